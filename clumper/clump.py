@@ -1,5 +1,8 @@
 import json
 import csv
+import heapq
+import math
+import operator
 import pathlib
 import itertools as it
 import urllib.request
@@ -9,6 +12,56 @@ from statistics import mean, variance, stdev, median
 from clumper.decorators import return_value_if_empty, grouped, dict_collection_only
 
 
+def _only_floats(values):
+    """
+    Checks if all values are floats such that we can skip the exact (but slow)
+    fraction arithmetic of the `statistics` module. Ints are not included because
+    the `statistics` module keeps their results exact, also beyond 2**53.
+    """
+    return all(type(v) is float for v in values)
+
+
+def _variance(values):
+    """
+    Calculates the sample variance using `math.fsum` for floats, falls back
+    to `statistics.variance`. For floats the result can differ in the last
+    bits from `statistics.variance` because it is not computed exactly.
+    """
+    if len(values) > 1 and _only_floats(values):
+        try:
+            avg = math.fsum(values) / len(values)
+            return math.fsum((v - avg) ** 2 for v in values) / (len(values) - 1)
+        except (OverflowError, ValueError):
+            pass
+    return variance(values)
+
+
+def _stdev(values):
+    """
+    Calculates the sample standard deviation, see `_variance`.
+    """
+    if len(values) > 1 and _only_floats(values):
+        return math.sqrt(_variance(values))
+    return stdev(values)
+
+
+_SUMMARY_FUNCS = {
+    "mean": mean,
+    "count": len,
+    "unique": lambda d: list(set(d)),
+    "n_unique": lambda d: len(set(d)),
+    "sum": sum,
+    "min": min,
+    "max": max,
+    "median": median,
+    "var": _variance,
+    "std": _stdev,
+    "values": lambda d: d,
+    "first": lambda d: d[0],
+    "last": lambda d: d[-1],
+}
+
+
 class Clumper:
     """
     This object adds methods to a list of dictionaries that make
@@ -25,8 +78,8 @@ class Clumper:
     ```
     """
 
-    def __init__(self, blob, groups=tuple()):
-        self.blob = blob.copy()
+    def __init__(self, blob, groups=tuple(), _copy=True):
+        self.blob = blob.copy() if _copy else blob
         self.groups = groups
 
     def __len__(self):
@@ -192,8 +245,11 @@ class Clumper:
         """
         Creates a new collection of data while preserving settings of the
         current collection (most notably, `groups`).
+
+        The verbs always pass a list that they just made themselves, so this
+        does not make a defensive copy of `blob`.
         """
-        return Clumper(blob, groups=self.groups)
+        return Clumper(blob, groups=self.groups, _copy=False)
 
     def group_by(self, *cols):
         """
@@ -230,13 +286,13 @@ class Clumper:
         self.groups = tuple()
         return self
 
-    @grouped
     @dict_collection_only
     def transform(self, **kwargs):
         """
         Does an aggregation just like `.agg()` however instead of reducing the rows we
         merge the results back with the original data. This saves a lot of compute time
-        because effectively this prevents us from performing a join.
+        because effectively this prevents us from performing a join. The items keep
+        the order they have in the original collection, also when a group is active.
 
         ![](../img/transform-with-groups.png)
 
@@ -266,17 +322,29 @@ class Clumper:
 
         expected = [
             {'a': 6, 'grp': 'a', 's': 18, 'u': [5, 6, 7]},
-            {'a': 7, 'grp': 'a', 's': 18, 'u': [5, 6, 7]},
-            {'a': 5, 'grp': 'a', 's': 18, 'u': [5, 6, 7]},
             {'a': 2, 'grp': 'b', 's': 11, 'u': [9, 2]},
-            {'a': 9, 'grp': 'b', 's': 11, 'u': [9, 2]}
+            {'a': 7, 'grp': 'a', 's': 18, 'u': [5, 6, 7]},
+            {'a': 9, 'grp': 'b', 's': 11, 'u': [9, 2]},
+            {'a': 5, 'grp': 'a', 's': 18, 'u': [5, 6, 7]}
         ]
 
         assert tfm_clump.equals(expected)
         ```
         """
-        agg_results = self.agg(**kwargs)
-        return self.left_join(agg_results, mapping={k: k for k in self.groups})
+        # Every item belongs to exactly one group, so the summaries can be
+        # added to each item directly without joining them back.
+        keys, codes, buckets = self._buckets()
+        summaries = [self._create_new(rows)._summarise(**kwargs) for rows in buckets]
+        # Summaries that clash with an existing key get the same suffix as a join would.
+        clashes = set(self.keys()) - set(self.groups)
+        names = {k: (k + "_joined" if k in clashes else k) for k in kwargs.keys()}
+        result = []
+        for d, key in zip(self, keys):
+            summary = summaries[codes[key]]
+            new = d.copy()
+            new.update((names[k], v) for k, v in summary.items())
+            result.append(new)
+        return self._create_new(result)
 
     def equals(self, data):
         """
@@ -333,17 +401,65 @@ class Clumper:
         return self._create_new(uniques)
 
     @staticmethod
-    def _merge_dicts(d1, d2, mapping, suffix1, suffix2):
-        """
-        Merge two dictionaries together. Keeping suffixes in mind.
-        """
-        map_keys = list(mapping.keys()) + list(mapping.values())
-        keys_to_suffix = [
-            k for k in set(d1.keys()).intersection(set(d2.keys())) if k not in map_keys
-        ]
-        d1_new = {(k + suffix1 if k in keys_to_suffix else k): v for k, v in d1.items()}
-        d2_new = {(k + suffix2 if k in keys_to_suffix else k): v for k, v in d2.items()}
-        return {**d1_new, **d2_new}
+    def _plan_merge(left_cols, right_cols, mapping, lsuffix, rsuffix):
+        """
+        Determine the key-renames for merging two collections. Keeping suffixes in mind.
+        Returns a pair of dictionaries that map each original key to its merged key.
+        """
+        map_keys = set(mapping.keys()) | set(mapping.values())
+        keys_to_suffix = (left_cols & right_cols) - map_keys
+        l_renames = {k: (k + lsuffix if k in keys_to_suffix else k) for k in left_cols}
+        r_renames = {k: (k + rsuffix if k in keys_to_suffix else k) for k in right_cols}
+        return l_renames, r_renames
+
+    def _join(self, other, mapping, lsuffix, rsuffix, keep_unmatched):
+        """
+        Hash join shared by `left_join` and `inner_join`. The right collection is
+        indexed once on the mapped values such that each left item only needs a
+        single lookup. Items that miss one of the join keys never match. Items with
+        unhashable join values (like lists) are matched by comparing them one by one.
+        """
+        left_keys, right_keys = tuple(mapping.keys()), tuple(mapping.values())
+
+        index, keyed = {}, []
+        for d_j in other:
+            try:
+                key = tuple(d_j[k] for k in right_keys)
+            except KeyError:
+                continue
+            keyed.append((key, d_j))
+            try:
+                index.setdefault(key, []).append(d_j)
+            except TypeError:
+                pass
+
+        # Which keys need a suffix only depends on the keys in both collections.
+        l_renames, r_renames = Clumper._plan_merge(
+            {k for d in self for k in d.keys()},
+            {k for d in other for k in d.keys()},
+            mapping,
+            lsuffix,
+            rsuffix,
+        )
+
+        result = []
+        for d_i in self:
+            try:
+                key = tuple(d_i[k] for k in left_keys)
+            except KeyError:
+                key = None
+            try:
+                matches = index.get(key, []) if key is not None else []
+            except TypeError:
+                matches = [d_j for key_j, d_j in keyed if key_j == key]
+            for d_j in matches:
+                merged = {}
+                merged.update((l_renames[k], v) for k, v in d_i.items())
+                merged.update((r_renames[k], v) for k, v in d_j.items())
+                result.append(merged)
+            if keep_unmatched and not matches:
+                result.append(d_i)
+        return self._create_new(result)
 
     @dict_collection_only
     def left_join(self, other, mapping, lsuffix="", rsuffix="_joined"):
@@ -354,6 +470,11 @@ class Clumper:
         some items from the right set may appear if a merge is possible. There
         may be multiple copies of the left set if it can be joined multiple times.
 
+        Keys that are not part of the `mapping` but that appear in both collections
+        get a suffix in every joined item. This is decided on the keys of the entire
+        collections, so a key gets its suffix even if one of the two joined items
+        happens to not have it.
+
         ![](../img/left_join.png)
 
         Arguments:
@@ -389,28 +510,18 @@ class Clumper:
         assert result.equals(expected)
         ```
         """
-        result = []
-        # This is a naive implementation. Speedup seems possible.
-        for d_i in self:
-            values_i = [d_i[k] for k in mapping.keys() if k in d_i.keys()]
-            d_i_added = False
-            for d_j in other:
-                values_j = [d_j[k] for k in mapping.values() if k in d_j.keys()]
-                if len(mapping) == len(values_i) == len(values_j):
-                    if values_i == values_j:
-                        result.append(
-                            Clumper._merge_dicts(d_i, d_j, mapping, lsuffix, rsuffix)
-                        )
-                        d_i_added = True
-            if not d_i_added:
-                result.append(d_i)
-        return self._create_new(result)
+        return self._join(other, mapping, lsuffix, rsuffix, keep_unmatched=True)
 
     @dict_collection_only
     def inner_join(self, other, mapping, lsuffix="", rsuffix="_joined"):
         """
         Performs an inner join on two collections.
 
+        Keys that are not part of the `mapping` but that appear in both collections
+        get a suffix in every joined item. This is decided on the keys of the entire
+        collections, so a key gets its suffix even if one of the two joined items
+        happens to not have it.
+
         ![](../img/inner_join.png)
 
         Arguments:
@@ -445,18 +556,7 @@ class Clumper:
         assert result.equals(expected)
         ```
         """
-        result = []
-        # This is a naive implementation. Speedup seems possible.
-        for d_i in self:
-            values_i = [d_i[k] for k in mapping.keys() if k in d_i.keys()]
-            for d_j in other:
-                values_j = [d_j[k] for k in mapping.values() if k in d_j.keys()]
-                if len(mapping) == len(values_i) == len(values_j):
-                    if values_i == values_j:
-                        result.append(
-                            Clumper._merge_dicts(d_i, d_j, mapping, lsuffix, rsuffix)
-                        )
-        return self._create_new(result)
+        return self._join(other, mapping, lsuffix, rsuffix, keep_unmatched=False)
 
     @property
     def only_has_dictionaries(self):
@@ -480,6 +580,8 @@ class Clumper:
         It can also accept a string and it will try to fetch an appropriate function
         for you. If you pass a string it must be either: `mean`, `count`, `unique`,
         `n_unique`, `sum`, `min`, `max`, `median`, `values`, `var`, `std`, `first` or `last`.
+        For columns of floats `var` and `std` are calculated with `math.fsum` instead of
+        the exact (but slow) `statistics` module, so they can differ slightly from it.
 
         ![](../img/split-apply-combine.png)
 
@@ -541,20 +643,78 @@ class Clumper:
 
         expected = [
             {'a': 6, 'grp': 'a', 's': 18, 'u': [5, 6, 7]},
-            {'a': 7, 'grp': 'a', 's': 18, 'u': [5, 6, 7]},
-            {'a': 5, 'grp': 'a', 's': 18, 'u': [5, 6, 7]},
             {'a': 2, 'grp': 'b', 's': 11, 'u': [9, 2]},
-            {'a': 9, 'grp': 'b', 's': 11, 'u': [9, 2]}
+            {'a': 7, 'grp': 'a', 's': 18, 'u': [5, 6, 7]},
+            {'a': 9, 'grp': 'b', 's': 11, 'u': [9, 2]},
+            {'a': 5, 'grp': 'a', 's': 18, 'u': [5, 6, 7]}
         ]
 
         assert tfm_clump.equals(expected)
         ```
         """
-        res = {
-            name: self.summarise_col(func_str, col)
+        return Clumper([self._summarise(**kwargs)], groups=self.groups)
+
+    def _summarise(self, **kwargs):
+        """
+        Calculates the summaries for `agg` and `transform` as a single dictionary.
+        This method ignores groups.
+        """
+        # Extract every column that is needed in a single pass over the data.
+        columns = {col: [] for col, _ in kwargs.values()}
+        for d in self:
+            for col, values in columns.items():
+                if col in d:
+                    values.append(d[col])
+        # Every summary gets its own copy such that it is free to change the list.
+        return {
+            name: Clumper._summary_func(func_str)(list(columns[col]))
             for name, (col, func_str) in kwargs.items()
         }
-        return Clumper([res], groups=self.groups)
+
+    def _buckets(self):
+        """
+        Buckets the items on their group, specified by `.group_by()`, in a single pass.
+        Returns the group key of every item, a dictionary that maps each key to its
+        integer code and the buckets of items indexed by that code.
+        """
+        # Without groups the entire collection is a single group, no hashing needed.
+        if len(self.groups) == 0:
+            if len(self) == 0:
+                return [], {}, []
+            return [()] * len(self), {(): 0}, [self.blob[:]]
+
+        # Each distinct group gets an integer code in order of first appearance and
+        # the items are collected in a list of buckets that is indexed by that code.
+        # A single group column is hashed on its value directly, skipping the tuple.
+        if len(self.groups) == 1:
+            col = self.groups[0]
+            keys = [d.get(col) for d in self]
+        else:
+            keys = [tuple(d.get(c) for c in self.groups) for d in self]
+        codes, buckets = {}, []
+        for d, key in zip(self, keys):
+            code = codes.get(key)
+            if code is None:
+                code = codes[key] = len(buckets)
+                buckets.append([])
+            buckets[code].append(d)
+        return keys, codes, buckets
+
+    @dict_collection_only
+    def _partition(self):
+        """
+        Splits the data into groups, specified by `.group_by()` by hashing the group values.
+        Returns a list of (group-values, clumper)-pairs in order of first appearance.
+        """
+        _, codes, buckets = self._buckets()
+        single = len(self.groups) == 1
+        return [
+            (
+                {k: v for k, v in zip(self.groups, (key,) if single else key)},
+                self._create_new(rows),
+            )
+            for key, rows in zip(codes.keys(), buckets)
+        ]
 
     @dict_collection_only
     def _subsets(self):
@@ -562,14 +722,7 @@ class Clumper:
         Subsets the data into groups, specified by `.group_by()`.
         Only subsets that have length > 0 are returned.
         """
-        result = []
-        for gc in self._group_combos():
-            subset = self.copy()
-            for key, value in gc.items():
-                subset = subset.keep(lambda d: d[key] == value)
-            if len(subset) > 0:
-                result.append(subset)
-        return result
+        return [subset for _, subset in self._partition()]
 
     def concat(self, *other):
         """
@@ -589,18 +742,13 @@ class Clumper:
         assert len(c1.concat(c2).concat(c3)) == 3
         ```
         """
-
-        data = reduce(lambda a, b: a + b, [o.blob for o in other])
-        return self._create_new(self.blob + data)
+        return self._create_new(list(it.chain(self.blob, *[o.blob for o in other])))
 
     def _group_combos(self):
         """
-        Returns a dictionary of group-value/clumper pairs.
+        Returns a list of dictionaries with the group-values that occur in the data.
         """
-        combinations = [
-            comb for comb in it.product(*[self.unique(c) for c in self.groups])
-        ]
-        return [{k: v for k, v in zip(self.groups, comb)} for comb in combinations]
+        return [combo for combo, _ in self._partition()]
 
     def keep(self, *funcs):
         """
@@ -623,10 +771,10 @@ class Clumper:
         assert clump.equals(expected)
         ```
         """
-        data = self.blob.copy()
-        for func in funcs:
-            data = [d for d in data if func(d)]
-        return self._create_new(data)
+        if len(funcs) == 1:
+            func = funcs[0]
+            return self._create_new([d for d in self.blob if func(d)])
+        return self._create_new([d for d in self.blob if all(f(d) for f in funcs)])
 
     def head(self, n=5):
         """
@@ -654,8 +802,7 @@ class Clumper:
             raise ValueError(f"`n` must be a positive integer, got {n}")
         if n < 0:
             raise ValueError(f"`n` must be a positive integer, got {n}")
-        n = min(n, len(self))
-        return self._create_new([self.blob[i] for i in range(n)])
+        return self._create_new(self.blob[:n])
 
     def tail(self, n=5):
         """
@@ -682,8 +829,7 @@ class Clumper:
             raise ValueError(f"`n` must be a positive integer, got {n}")
         if n < 0:
             raise ValueError(f"`n` must be positive, got {n}")
-        n = min(n, len(self))
-        return self._create_new(self.blob[len(self) - n : len(self)])
+        return self._create_new(self.blob[-n:] if n > 0 else [])
 
     @dict_collection_only
     def select(self, *keys):
@@ -709,7 +855,12 @@ class Clumper:
         assert all(["c" not in d.keys() for d in clump])
         ```
         """
-        return self._create_new([{k: d[k] for k in keys} for d in self.blob])
+        if len(keys) == 0:
+            return self._create_new([{} for _ in self.blob])
+        getter = operator.itemgetter(*keys)
+        if len(keys) == 1:
+            return self._create_new([{keys[0]: getter(d)} for d in self.blob])
+        return self._create_new([dict(zip(keys, getter(d))) for d in self.blob])
 
     @dict_collection_only
     def drop(self, *keys):
@@ -735,8 +886,9 @@ class Clumper:
         assert all(["c" not in d.keys() for d in clump])
         ```
         """
+        to_drop = frozenset(keys)
         return self._create_new(
-            [{k: v for k, v in d.items() if k not in keys} for d in self.blob]
+            [{k: v for k, v in d.items() if k not in to_drop} for d in self.blob]
         )
 
     @grouped
@@ -776,8 +928,15 @@ class Clumper:
         ```
         """
         data = []
-        for d in self.blob.copy():
-            new = {k: v for k, v in d.items()}
+        if len(kwargs) == 1:
+            [(key, func)] = kwargs.items()
+            for d in self.blob:
+                new = d.copy()
+                new[key] = func(new)
+                data.append(new)
+            return self._create_new(data)
+        for d in self.blob:
+            new = d.copy()
             for key, func in kwargs.items():
                 new[key] = func(new)
             data.append(new)
@@ -818,6 +977,43 @@ class Clumper:
         """
         return self._create_new(sorted(self.blob, key=key, reverse=reverse))
 
+    @grouped
+    def top(self, n, key, reverse=False):
+        """
+        Selects the first `n` items as if the collection was sorted first. This gives
+        the same result as `.sort(key, reverse).head(n)` but it does not need to sort
+        the entire collection which makes it a lot faster when `n` is small.
+
+        Arguments:
+            n: the number of items to grab
+            key: the function to sort the items by
+            reverse: if `True` the largest `n` items are selected
+
+        Warning:
+            This method is aware of groups. Expect different results if a group is active.
+
+        Usage:
+
+        ```python
+        from clumper import Clumper
+
+        list_dicts = [{'a': 3}, {'a': 1}, {'a': 4}, {'a': 2}]
+
+        result = Clumper(list_dicts).top(2, key=lambda d: d['a'])
+        assert result.collect() == [{'a': 1}, {'a': 2}]
+
+        result = Clumper(list_dicts).top(2, key=lambda d: d['a'], reverse=True)
+        assert result.collect() == [{'a': 4}, {'a': 3}]
+        ```
+        """
+        if not isinstance(n, int):
+            raise ValueError(f"`n` must be a positive integer, got {n}")
+        if n < 0:
+            raise ValueError(f"`n` must be a positive integer, got {n}")
+        if reverse:
+            return self._create_new(heapq.nlargest(n, self.blob, key=key))
+        return self._create_new(heapq.nsmallest(n, self.blob, key=key))
+
     def map(self, func):
         """
         Directly map one item to another one using a function.
@@ -865,8 +1061,15 @@ class Clumper:
         ```
         """
         if overlap:
-            all_keys = [set(d.keys()) for d in self]
-            return list(reduce(lambda a, b: a.intersection(b), all_keys))
+            if len(self) == 0:
+                return []
+            items = iter(self.blob)
+            common = set(next(items).keys())
+            for d in items:
+                common &= d.keys()
+                if not common:
+                    break
+            return list(common)
         return list({k for d in self for k in d.keys()})
 
     @dict_collection_only
@@ -898,17 +1101,18 @@ class Clumper:
         """
         # you can keep the same name by just using *args or overwrite using **kwargs
         kwargs = {**kwargs, **{k: k for k in to_explode}}
-        new_name, to_explode = kwargs.keys(), kwargs.values()
+        new_name, to_explode = tuple(kwargs.keys()), tuple(kwargs.values())
+        # the exploded keys that got a new name are dropped while we copy
+        to_drop = frozenset(k for k in to_explode if k not in new_name)
 
         res = []
         for d in self.blob:
-            combinations = it.product(*[d[v] for v in to_explode])
-            for comb in combinations:
-                new_dict = d.copy()
-                for k, v in zip(new_name, comb):
-                    new_dict[k] = v
+            base = {k: v for k, v in d.items() if k not in to_drop}
+            for comb in it.product(*[d[v] for v in to_explode]):
+                new_dict = base.copy()
+                new_dict.update(zip(new_name, comb))
                 res.append(new_dict)
-        return self._create_new(res).drop(*[k for k in to_explode if k not in new_name])
+        return self._create_new(res)
 
     def rename(self, **kwargs):
         """
@@ -968,7 +1172,7 @@ class Clumper:
         ```
         """
         return self._create_new(
-            [{k: reduce(func, [b for b in self.blob]) for k, func in kwargs.items()}]
+            [{k: reduce(func, self.blob) for k, func in kwargs.items()}]
         )
 
     def pipe(self, func, *args, **kwargs):
@@ -1026,7 +1230,7 @@ class Clumper:
         assert id(c1) != id(c2)
         ```
         """
-        return self._create_new([d for d in self.blob])
+        return self._create_new(self.blob[:])
 
     def summarise_col(self, func, key):
         """
@@ -1035,6 +1239,8 @@ class Clumper:
         It can also accept a string and it will try to fetch an appropriate function
         for you. If you pass a string it must be either: `mean`, `count`, `unique`,
         `n_unique`, `sum`, `min`, `max`, `median`, `values`, `var`, `std`, `first` or `last`.
+        For columns of floats `var` and `std` are calculated with `math.fsum` instead of
+        the exact (but slow) `statistics` module, so they can differ slightly from it.
 
         Note that this method **ignores groups**. It also does not return a `Clumper`
         collection.
@@ -1050,29 +1256,26 @@ class Clumper:
         assert clump.summarise_col(lambda d: d[-1], "a") == 3
         ```
         """
-        funcs = {
-            "mean": mean,
-            "count": lambda d: len(d),
-            "unique": lambda d: list(set(d)),
-            "n_unique": lambda d: len(set(d)),
-            "sum": sum,
-            "min": min,
-            "max": max,
-            "median": median,
-            "var": variance,
-            "std": stdev,
-            "values": lambda d: d,
-            "first": lambda d: d[0],
-            "last": lambda d: d[-1],
-        }
+        return Clumper._summary_func(func)(self._column(key))
+
+    def _column(self, key):
+        """
+        Returns a list with all the values for `key`, skipping items that don't have it.
+        """
+        return [d[key] for d in self.blob if key in d]
+
+    @staticmethod
+    def _summary_func(func):
+        """
+        Fetches the summary function that belongs to a string. Functions are passed through.
+        """
         if isinstance(func, str):
-            if func not in funcs.keys():
+            if func not in _SUMMARY_FUNCS.keys():
                 raise ValueError(
-                    f"Passed `func` must be in {funcs.keys()}, got {func}."
+                    f"Passed `func` must be in {_SUMMARY_FUNCS.keys()}, got {func}."
                 )
-            func = funcs[func]
-        array = [d[key] for d in self if key in d.keys()]
-        return func(array)
+            func = _SUMMARY_FUNCS[func]
+        return func
 
     @dict_collection_only
     @return_value_if_empty(value=None)
@@ -1098,7 +1301,7 @@ class Clumper:
         Clumper(list_of_dicts).sum("b")
         ```
         """
-        return self.summarise_col("sum", col)
+        return sum(self._column(col))
 
     @dict_collection_only
     @return_value_if_empty(value=None)
@@ -1124,7 +1327,7 @@ class Clumper:
         assert round(Clumper(list_of_dicts).mean("b"), 1) == 6.7
         ```
         """
-        return self.summarise_col("mean", col)
+        return mean(self._column(col))
 
     @dict_collection_only
     @return_value_if_empty(value=0)
@@ -1150,7 +1353,7 @@ class Clumper:
         assert Clumper(list_of_dicts).count("b") == 3
         ```
         """
-        return self.summarise_col("count", col)
+        return len(self._column(col))
 
     @dict_collection_only
     @return_value_if_empty(value=0)
@@ -1176,7 +1379,7 @@ class Clumper:
         assert Clumper(list_of_dicts).n_unique("b") == 2
         ```
         """
-        return self.summarise_col("n_unique", col)
+        return len({d[col] for d in self.blob if col in d})
 
     @dict_collection_only
     @return_value_if_empty(value=None)
@@ -1202,7 +1405,7 @@ class Clumper:
         assert Clumper(list_of_dicts).min("b") == 6
         ```
         """
-        return self.summarise_col("min", col)
+        return min(self._column(col))
 
     @dict_collection_only
     @return_value_if_empty(value=None)
@@ -1228,7 +1431,7 @@ class Clumper:
         assert Clumper(list_of_dicts).max("b") == 7
         ```
         """
-        return self.summarise_col("max", col)
+        return max(self._column(col))
 
     @dict_collection_only
     @return_value_if_empty(value=[])
@@ -1254,4 +1457,4 @@ class Clumper:
         assert Clumper(list_of_dicts).unique("b") == [6, 7]
         ```
         """
-        return self.summarise_col("unique", col)
+        return list({d[col] for d in self.blob if col in d})
@@ -1,4 +1,4 @@
-from functools import wraps, reduce
+from functools import wraps
 from copy import deepcopy
 
 
@@ -11,7 +11,7 @@ def return_value_if_empty(value=None):
     def decorator_return(method):
         @wraps(method)
         def wrapped(clumper, col):
-            if len([b for b in clumper if col in b.keys()]) == 0:
+            if not any(col in b for b in clumper):
                 return value
             return method(clumper, col)
 
@@ -23,6 +23,7 @@ def return_value_if_empty(value=None):
 def grouped(method):
     """
     Handles the behavior when a group is present on a clumper object.
+    Without groups the method is applied to the entire collection directly.
     """
 
     @wraps(method)
@@ -32,12 +33,13 @@ def grouped(method):
 
         # You may note the deepcopy() here in the keyword arguments. This is done
         # such that state-ful functions (like `row_number`) automatically reset.
-        results = [method(s, *args, **deepcopy(kwargs)) for s in clumper._subsets()]
-        blob = reduce(lambda a, b: a + b, [c.collect() for c in results])
-
-        # We need to make sure the grouping keys are still available when we do "agg".
-        if method.__name__ == "agg":
-            blob = [{**s, **b} for s, b in zip(clumper._group_combos(), blob)]
+        blob = []
+        for combo, subset in clumper._partition():
+            result = method(subset, *args, **deepcopy(kwargs)).collect()
+            # We need to make sure the grouping keys are still available when we do "agg".
+            if method.__name__ == "agg":
+                result = [{**combo, **b} for b in result]
+            blob.extend(result)
         return clumper._create_new(blob)
 
     return wrapped
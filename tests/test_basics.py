@@ -26,3 +26,32 @@ def test_iteration():
     data = [1, 2, 3, 4, 5]
     blob = [i for i in Clumper(data)]
     assert data == blob
+
+
+def test_concat():
+    """
+    Concatenating keeps the order and works with any number of collections.
+    """
+    c1, c2, c3 = Clumper([{"a": 1}]), Clumper([{"a": 2}, {"a": 3}]), Clumper([])
+    assert c1.concat().collect() == [{"a": 1}]
+    assert c1.concat(c2, c3).collect() == [{"a": 1}, {"a": 2}, {"a": 3}]
+    assert c3.concat(c2, c1).collect() == [{"a": 2}, {"a": 3}, {"a": 1}]
+
+
+def test_copy_is_independent():
+    """
+    Verbs skip the defensive copy, so make sure `copy` still gives a new list.
+    """
+    clump = Clumper([{"a": 1}, {"a": 2}])
+    copied = clump.copy()
+    copied.blob.append({"a": 3})
+    assert len(clump) == 2
+    assert len(copied) == 3
+
+
+def test_keys_overlap():
+    data = [{"a": 1, "b": 2, "c": 3}, {"a": 2, "b": 3}, {"b": 4, "c": 5}, {"d": 1}]
+    assert set(Clumper(data[:2]).keys(overlap=True)) == {"a", "b"}
+    assert set(Clumper(data[:3]).keys(overlap=True)) == {"b"}
+    assert Clumper(data).keys(overlap=True) == []
+    assert Clumper([]).keys(overlap=True) == []
@@ -1,3 +1,6 @@
+import statistics
+from fractions import Fraction
+
 import pytest
 
 from clumper import Clumper
@@ -42,3 +45,51 @@ def test_minimum(n):
 
 def test_maximum(n):
     assert make_clumper(n, constant=False).max("i") == n - 1
+
+
+STATS = {"mean": statistics.mean, "var": statistics.variance, "std": statistics.stdev}
+
+
+def test_float_mean_matches_statistics_exactly():
+    values = [(i * 7919) % 101 / 7 for i in range(500)]
+    clump = Clumper([{"x": v} for v in values])
+    assert clump.mean("x") == statistics.mean(values)
+    assert clump.summarise_col("mean", "x") == statistics.mean(values)
+
+
+@pytest.mark.parametrize("func", ["var", "std"])
+def test_float_summaries_match_statistics(func):
+    """
+    The fast summaries for floats are not exact, but they should agree with the
+    `statistics` module up to the last few bits.
+    """
+    values = [(i * 7919) % 101 + 0.25 for i in range(500)]
+    clump = Clumper([{"x": v} for v in values])
+    assert clump.summarise_col(func, "x") == pytest.approx(STATS[func](values))
+
+
+@pytest.mark.parametrize("func", ["mean", "var", "std"])
+def test_int_summaries_match_statistics(func):
+    """
+    Int columns should give the exact same result, and type, as the `statistics` module.
+    """
+    values = [(i * 7919) % 101 for i in range(500)]
+    clump = Clumper([{"x": v} for v in values])
+    result = clump.summarise_col(func, "x")
+    assert result == STATS[func](values)
+    assert type(result) is type(STATS[func](values))
+
+
+def test_large_int_summaries_stay_exact():
+    """
+    Ints beyond 2**53 cannot be represented as floats, the results must stay exact.
+    """
+    clump = Clumper([{"a": 1700000000000000001}, {"a": 1700000000000000003}])
+    assert clump.mean("a") == 1700000000000000002
+    assert clump.summarise_col("mean", "a") == 1700000000000000002
+    assert clump.summarise_col("var", "a") == 2
+
+
+def test_mean_falls_back_for_other_numbers():
+    clump = Clumper([{"x": Fraction(1, 3)}, {"x": Fraction(2, 3)}])
+    assert clump.mean("x") == Fraction(1, 2)
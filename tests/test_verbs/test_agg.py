@@ -35,3 +35,32 @@ def test_with_groups(n):
     length = len(clump)
     n_items = clump.group_by("a", "b").agg(r=("r", "sum")).sum("r")
     assert n_items == length
+
+
+def test_agg_partially_missing_keys():
+    """
+    Keys that are missing from some items should only summarise the items that have them.
+    """
+    data = [{"a": 1, "b": 10}, {"a": 2}, {"a": 3, "b": 20}]
+    c = Clumper(data).agg(
+        a_sum=("a", "sum"), b_sum=("b", "sum"), b_n=("b", "count"), a_max=("a", "max")
+    )
+    assert c.collect() == [{"a_sum": 6, "b_sum": 30, "b_n": 2, "a_max": 3}]
+
+
+def test_agg_summaries_get_their_own_values():
+    """
+    A summary that changes its input should not affect the other summaries.
+    """
+    data = [{"a": 3}, {"a": 1}, {"a": 2}]
+    c = Clumper(data).agg(
+        lo=("a", lambda v: (v.sort(), v[0])[1]),
+        first=("a", "first"),
+        x=("a", "values"),
+        y=("a", "values"),
+    )
+    res = c.collect()[0]
+    assert res["lo"] == 1
+    assert res["first"] == 3
+    assert res["x"] == [3, 1, 2]
+    assert res["x"] is not res["y"]
@@ -29,6 +29,16 @@ def test_subsets_sizes(keys, size):
         assert len(c) == size
 
 
+def test_partition_matches_group_values():
+    prod = it.product([1, 2], [1, 2], [True, False], ["a", "b"])
+    clump = Clumper([{"r": 1, "i": i, "j": j, "a": a, "b": b} for i, j, a, b in prod])
+    parts = clump.group_by("a", "b")._partition()
+    assert len(parts) == 4
+    for combo, subset in parts:
+        assert subset.groups == ("a", "b")
+        assert all(d["a"] == combo["a"] and d["b"] == combo["b"] for d in subset)
+
+
 def test_mutate_group_aware():
     """
     Does `row_number` reset during mutate if a group is active?
@@ -38,3 +48,11 @@ def test_mutate_group_aware():
     assert len(clump) == len(data)
     assert clump.groups == ("bool",)
     assert set(clump.unique("r")) == {1, 2, 3, 4, 5, 6, 7, 8, 9, 10}
+
+
+def test_partition_without_groups():
+    clump = Clumper([{"a": 1}, {"a": 2}])
+    [(combo, subset)] = clump._partition()
+    assert combo == {}
+    assert subset.collect() == clump.collect()
+    assert Clumper([])._partition() == []
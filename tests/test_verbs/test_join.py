@@ -72,3 +72,54 @@ def test_left_join_no_overlap():
         .collect()
     )
     assert joined == d1
+
+
+def test_inner_join_multiple_keys():
+    d1 = [{"a": 1, "b": 1, "d": 1}, {"a": 1, "b": 2, "d": 1}, {"b": 2, "d": 1}]
+    d2 = [
+        {"x": 1, "y": 1, "c": 1},
+        {"x": 1, "y": 2, "c": 2},
+        {"x": 1, "y": 2, "c": 3},
+        {"y": 2, "c": 4},
+    ]
+    joined = Clumper(d1).inner_join(Clumper(d2), mapping={"a": "x", "b": "y"}).collect()
+    expected = [
+        {"a": 1, "b": 1, "d": 1, "x": 1, "y": 1, "c": 1},
+        {"a": 1, "b": 2, "d": 1, "x": 1, "y": 2, "c": 2},
+        {"a": 1, "b": 2, "d": 1, "x": 1, "y": 2, "c": 3},
+    ]
+    assert joined == expected
+
+
+def test_join_unhashable_keys():
+    """
+    Join values that cannot be hashed should still be matched on equality.
+    """
+    d1 = [{"k": [1], "x": 1}, {"k": [2], "x": 2}, {"k": 3, "x": 3}]
+    d2 = [{"k": [1], "y": 1}, {"k": 3, "y": 3}, {"k": [1], "y": 10}]
+    left = Clumper(d1).left_join(Clumper(d2), mapping={"k": "k"}).collect()
+    assert left == [
+        {"k": [1], "x": 1, "y": 1},
+        {"k": [1], "x": 1, "y": 10},
+        {"k": [2], "x": 2},
+        {"k": 3, "x": 3, "y": 3},
+    ]
+    inner = Clumper(d1).inner_join(Clumper(d2), mapping={"k": "k"}).collect()
+    assert inner == [
+        {"k": [1], "x": 1, "y": 1},
+        {"k": [1], "x": 1, "y": 10},
+        {"k": 3, "x": 3, "y": 3},
+    ]
+
+
+def test_join_suffix_decided_on_collections():
+    """
+    A key that appears in both collections always gets a suffix, even when
+    the left item that is joined doesn't have it.
+    """
+    left = Clumper([{"id": 1, "x": 1}, {"id": 2}])
+    right = Clumper([{"id": 2, "x": 5}])
+    joined = left.left_join(right, mapping={"id": "id"}).collect()
+    assert joined == [{"id": 1, "x": 1}, {"id": 2, "x_joined": 5}]
+    joined = left.inner_join(right, mapping={"id": "id"}).collect()
+    assert joined == [{"id": 2, "x_joined": 5}]
@@ -43,3 +43,13 @@ def test_keep_does_not_mutate():
 def test_keep_multiple_queries(base_clumper):
     c = base_clumper.keep(lambda d: d["i"] < 20, lambda d: d["i"] >= 10)
     assert len(c) == 10
+
+
+def test_keep_short_circuits():
+    """
+    Later functions are only applied to items that pass the earlier ones.
+    """
+    data = [{"a": 1}, {"b": 2}, {"a": 3}]
+    c = Clumper(data).keep(lambda d: "a" in d, lambda d: d["a"] > 1)
+    assert c.collect() == [{"a": 3}]
+    assert len(Clumper(data).keep()) == 3
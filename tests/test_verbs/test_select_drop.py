@@ -0,0 +1,17 @@
+import pytest
+
+from clumper import Clumper
+
+
+@pytest.mark.parametrize("keys", [(), ("a",), ("a", "b"), ("c", "a", "b")])
+def test_select_keys(keys):
+    data = [{"a": 1, "b": 2, "c": 3}, {"a": 4, "b": 5, "c": 6}]
+    result = Clumper(data).select(*keys).collect()
+    assert result == [{k: d[k] for k in keys} for d in data]
+
+
+@pytest.mark.parametrize("keys", [(), ("a",), ("a", "b"), ("c", "d")])
+def test_drop_keys(keys):
+    data = [{"a": 1, "b": 2, "c": 3}, {"a": 4, "b": 5}]
+    result = Clumper(data).drop(*keys).collect()
+    assert result == [{k: v for k, v in d.items() if k not in keys} for d in data]
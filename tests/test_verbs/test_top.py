@@ -0,0 +1,31 @@
+import pytest
+
+from clumper import Clumper
+
+
+@pytest.mark.parametrize("n", [0, 1, 5, 26, 1000])
+@pytest.mark.parametrize("reverse", [True, False])
+def test_top_equals_sort_head(base_clumper, n, reverse):
+    """
+    Taking the top `n` items should be the same as sorting and then taking the head.
+    """
+    key = lambda d: (d["i"] * 7) % 26  # noqa: E731
+    expected = base_clumper.sort(key, reverse=reverse).head(n).collect()
+    assert base_clumper.top(n, key, reverse=reverse).collect() == expected
+
+
+def test_top_with_groups():
+    data = [{"g": i % 2, "v": i} for i in range(10)]
+    result = Clumper(data).group_by("g").top(2, key=lambda d: d["v"], reverse=True)
+    assert result.collect() == [
+        {"g": 0, "v": 8},
+        {"g": 0, "v": 6},
+        {"g": 1, "v": 9},
+        {"g": 1, "v": 7},
+    ]
+
+
+@pytest.mark.parametrize("n", [-1, 2.5, "a"])
+def test_top_errors_raises(base_clumper, n):
+    with pytest.raises(ValueError):
+        base_clumper.top(n, key=lambda d: d["i"])
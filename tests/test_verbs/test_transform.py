@@ -0,0 +1,35 @@
+from clumper import Clumper
+
+
+def test_transform_keeps_order():
+    """
+    The summaries are added to each item while the original order is kept.
+    """
+    data = [{"a": i, "grp": "ab"[i % 2]} for i in range(6)]
+    result = Clumper(data).group_by("grp").transform(s=("a", "sum")).collect()
+    assert [d["a"] for d in result] == [0, 1, 2, 3, 4, 5]
+    assert [d["s"] for d in result] == [6, 9, 6, 9, 6, 9]
+
+
+def test_transform_no_groups():
+    data = [{"a": 1}, {"a": 2}, {"a": 3}]
+    result = Clumper(data).transform(m=("a", "max"), n=("a", "count")).collect()
+    assert result == [{"a": i, "m": 3, "n": 3} for i in [1, 2, 3]]
+
+
+def test_transform_name_clash():
+    """
+    Summaries that share a name with an existing key should not overwrite it.
+    """
+    data = [{"a": 1, "grp": 1}, {"a": 2, "grp": 1}]
+    result = Clumper(data).group_by("grp").transform(a=("a", "sum")).collect()
+    assert result == [
+        {"a": 1, "grp": 1, "a_joined": 3},
+        {"a": 2, "grp": 1, "a_joined": 3},
+    ]
+
+
+def test_transform_repeated_group_column():
+    data = [{"a": 1, "b": 2}, {"a": 1, "b": 3}, {"a": 2, "b": 1}]
+    result = Clumper(data).group_by("a", "a").transform(s=("b", "sum")).collect()
+    assert [d["s"] for d in result] == [5, 5, 1]